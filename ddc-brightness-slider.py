@@ -4,7 +4,15 @@
 DDC Brightness Slider for XFCE4
 
 GTK3 tray icon with a brightness slider that controls monitor brightness
-via ddccontrol (DDC/CI protocol over I2C).
+via DDC/CI over I2C. VCP reads and writes go straight to /dev/i2c-N; the
+ddccontrol CLI is used for monitor detection and as a fallback when the
+bus can't be opened directly.
+
+The fallback is slow: every call starts a new ddccontrol process that
+reopens the bus and re-reads the monitor's capabilities before touching
+the register. ddccontrol has no flag to skip this (-c requests a
+capability query rather than suppressing one), so the only way around it
+is the direct I2C path.
 
 Configuration:
   Edit the constants below or use command-line arguments.
@@ -30,12 +38,15 @@ from gi.repository import Gtk, Gdk, GLib
 import subprocess
 import argparse
 import dataclasses
+import fcntl
+import functools
 import json
 import os
 import re
 import sys
 import signal
 import threading
+import time
 
 DEFAULT_CONFIG_DIR = os.path.expanduser("~/.config/ddc-brightness")
 DEFAULT_CONFIG_PATH = os.path.join(DEFAULT_CONFIG_DIR, "config.json")
@@ -55,6 +66,22 @@ DEFAULT_STEP = 5
 DEFAULT_SCROLL_STEP = 1
 ICON_NAME = "display-brightness-symbolic"
 
+I2C_SLAVE = 0x0703          # ioctl: set slave address for /dev/i2c-N
+DDC_CI_ADDR = 0x37          # DDC/CI slave address (0x6E in 8-bit form)
+DDC_CI_HOST = 0x51          # source address of host-originated messages
+DDC_REPLY_DELAY = 0.04      # seconds to wait before reading a VCP reply
+DDC_CACHE_TTL = 2.0         # seconds a read or written value is trusted without re-reading
+
+SLIDER_DEBOUNCE_MS = 20         # direct I2C writes take a few ms
+SCROLL_DEBOUNCE_MS = 30
+DDCCONTROL_DEBOUNCE_MS = 150    # each ddccontrol write forks and re-probes the monitor
+DDCCONTROL_SCROLL_DEBOUNCE_MS = 80
+DDC_WRITE_INTERVAL = 0.05       # DDC/CI: minimum gap between consecutive messages on a bus
+
+# ddccontrol -r output: "Control 0x10: +/70/100 [Brightness]" or " > current value = 70"
+_RE_TRIPLE = re.compile(rb'\+/(\d+)/(\d+)')
+_RE_CURRENT = re.compile(rb'current\s+value\s*=\s*(\d+)')
+
 
 @dataclasses.dataclass
 class MonitorInfo:
@@ -90,38 +117,293 @@ def detect_i2c_devices() -> list[tuple[str, str]]:
     return devices
 
 
+def _ddc_checksum(data: bytes, initial: int) -> int:
+    """XOR checksum over a DDC/CI frame, seeded with the destination address."""
+    chk = initial
+    for b in data:
+        chk ^= b
+    return chk
+
+
 class DDCController:
 
+    # Pending async reads per bus: [(controller, callback), ...]. Brightness and
+    # contrast share a bus, and a monitor only answers the last request, so a bus
+    # listed in _reads_in_flight starts nothing new until that read completes.
+    _read_queues: dict[str, list] = {}
+    _reads_in_flight: set[str] = set()
+    # Time of the last message sent on each bus, and direct writes held back until
+    # DDC_WRITE_INTERVAL has passed: device -> {controller: value}, latest value wins
+    _last_message: dict[str, float] = {}
+    _pending_writes: dict[str, dict] = {}
+
     def __init__(self, i2c_dev: str, register: str):
         self.device = f"dev:{i2c_dev}"
         self.register = register
+        self.vcp = int(register, 16)
+        self.fd = None
+        self._cache_val: int | None = None
+        self._cache_ts = 0.0
+        try:
+            self.fd = os.open(i2c_dev, os.O_RDWR)
+            fcntl.ioctl(self.fd, I2C_SLAVE, DDC_CI_ADDR)
+        except OSError as e:
+            # A long-lived helper process can't avoid this: it would run as the same
+            # user and hit the same error, and ddccontrol has no command mode to keep
+            # open. So every fallback call costs one ddccontrol run.
+            print(f"[ddc-brightness] Direct I2C access to {i2c_dev} unavailable ({e}), "
+                  f"falling back to ddccontrol", file=sys.stderr)
+            if self.fd is not None:
+                os.close(self.fd)
+                self.fd = None
+        self._pkts: list[bytes] = []
+        if self.fd is not None:
+            # Set VCP Feature: 0x51 0x84 0x03 <vcp> <val hi> <val lo> <chk>, one per value
+            for v in range(0, 101):
+                frame = bytes([DDC_CI_HOST, 0x84, 0x03, self.vcp, 0x00, v])
+                self._pkts.append(frame + bytes([_ddc_checksum(frame, DDC_CI_ADDR << 1)]))
+
+    @property
+    def is_direct(self) -> bool:
+        return self.fd is not None
+
+    @property
+    def cached_value(self) -> int | None:
+        """Last value read or written, or None once it is older than DDC_CACHE_TTL."""
+        if time.monotonic() - self._cache_ts < DDC_CACHE_TTL:
+            return self._cache_val
+        return None
+
+    def _remember(self, value: int | None) -> int | None:
+        if value is not None:
+            self._cache_val = value
+            self._cache_ts = time.monotonic()
+        return value
 
     def get_brightness(self) -> int | None:
+        cached = self.cached_value
+        if cached is not None:
+            return cached
+        if self.fd is not None:
+            return self._remember(self._i2c_get())
+        return self._remember(self._ddccontrol_get())
+
+    def get_brightness_async(self, callback):
+        """Read the register without blocking the GTK main loop.
+        callback(value) is invoked from the main loop; value is None on error."""
+        cached = self.cached_value
+        if cached is not None:
+            callback(cached)
+            return
+        self._read_queues.setdefault(self.device, []).append((self, callback))
+        self._start_next_read(self.device)
+
+    def set_brightness(self, value: int) -> bool:
+        value = max(0, min(100, int(value)))
+        if self.fd is not None:
+            ok = self._i2c_set(value)
+        else:
+            ok = self._ddccontrol_set(value)
+        if ok:
+            self._remember(value)
+        return ok
+
+    def _i2c_get(self) -> int | None:
+        if not self._i2c_request():
+            return None
+        time.sleep(DDC_REPLY_DELAY)
+        return self._i2c_read_reply()
+
+    @classmethod
+    def _start_next_read(cls, device: str):
+        """Start the next queued read on device unless one is already in flight."""
+        queue = cls._read_queues.get(device)
+        if device in cls._reads_in_flight or not queue:
+            return
+        ctrl, callback = queue.pop(0)
+        cls._reads_in_flight.add(device)
+        if ctrl.fd is not None:
+            ctrl._i2c_begin_read(callback)
+        else:
+            ctrl._ddccontrol_begin_read(callback)
+
+    def _finish_read(self, callback, value: int | None):
+        # Hand the bus to the next read before running the callback, so a callback
+        # that queues another read only appends to the queue
+        self._reads_in_flight.discard(self.device)
+        self._start_next_read(self.device)
+        callback(self._remember(value))
+
+    @classmethod
+    def _bus_delay_ms(cls, device: str) -> int:
+        """Milliseconds until DDC_WRITE_INTERVAL has passed since the last message on device."""
+        wait = cls._last_message.get(device, 0.0) + DDC_WRITE_INTERVAL - time.monotonic()
+        return int(wait * 1000) + 1 if wait > 0 else 0
+
+    def _i2c_begin_read(self, callback):
+        # Read the reply once the monitor has had DDC_REPLY_DELAY to prepare it,
+        # instead of sleeping on the main loop
+        delay = self._bus_delay_ms(self.device)
+        if delay:
+            GLib.timeout_add(delay, self._i2c_begin_read, callback)
+            return False
+        if not self._i2c_request():
+            self._finish_read(callback, None)
+            return False
+        GLib.timeout_add(int(DDC_REPLY_DELAY * 1000), self._i2c_end_read, callback)
+        return False
+
+    def _i2c_end_read(self, callback):
+        self._finish_read(callback, self._i2c_read_reply())
+        return False
+
+    def _i2c_request(self) -> bool:
+        # Get VCP Feature: 0x51 0x82 0x01 <vcp> <chk>
+        frame = bytes([DDC_CI_HOST, 0x82, 0x01, self.vcp])
+        try:
+            os.write(self.fd, frame + bytes([_ddc_checksum(frame, DDC_CI_ADDR << 1)]))
+            return True
+        except OSError as e:
+            print(f"[ddc-brightness] Error reading brightness: {e}", file=sys.stderr)
+            return False
+        finally:
+            self._last_message[self.device] = time.monotonic()
+
+    def _i2c_read_reply(self) -> int | None:
+        try:
+            reply = os.read(self.fd, 11)
+        except OSError as e:
+            print(f"[ddc-brightness] Error reading brightness: {e}", file=sys.stderr)
+            return None
+        finally:
+            self._last_message[self.device] = time.monotonic()
+        # Reply: 0x6E 0x88 0x02 <result> <vcp> <type> <max hi> <max lo> <cur hi> <cur lo> <chk>
+        if (len(reply) != 11 or reply[2] != 0x02 or reply[3] != 0x00 or reply[4] != self.vcp
+                or _ddc_checksum(reply[:10], 0x50) != reply[10]):
+            print(f"[ddc-brightness] Invalid VCP reply for {self.register}: {reply.hex()}",
+                  file=sys.stderr)
+            return None
+        return int.from_bytes(reply[8:10], "big")
+
+    def _i2c_set(self, value: int) -> bool:
+        pending = self._pending_writes.setdefault(self.device, {})
+        if (not pending and self.device not in self._reads_in_flight
+                and not self._bus_delay_ms(self.device)):
+            return self._i2c_write(value)
+        # Too close to the previous message on this bus (e.g. brightness then
+        # contrast from a preset): send the latest value once the gap has passed
+        if not pending:
+            GLib.timeout_add(self._write_delay_ms(self.device), self._flush_writes, self.device)
+        pending[self] = value
+        return True
+
+    @classmethod
+    def _write_delay_ms(cls, device: str) -> int:
+        if device in cls._reads_in_flight:
+            return int(DDC_WRITE_INTERVAL * 1000)
+        return max(1, cls._bus_delay_ms(device))
+
+    @classmethod
+    def _flush_writes(cls, device: str):
+        pending = cls._pending_writes[device]
+        if device in cls._reads_in_flight or cls._bus_delay_ms(device):
+            GLib.timeout_add(cls._write_delay_ms(device), cls._flush_writes, device)
+            return False
+        ctrl = next(iter(pending))
+        ctrl._i2c_write(pending.pop(ctrl))
+        if pending:
+            GLib.timeout_add(cls._write_delay_ms(device), cls._flush_writes, device)
+        return False
+
+    def _i2c_write(self, value: int) -> bool:
+        try:
+            os.write(self.fd, self._pkts[value])
+            return True
+        except OSError as e:
+            print(f"[ddc-brightness] Error setting brightness to {value}: {e}", file=sys.stderr)
+            return False
+        finally:
+            self._last_message[self.device] = time.monotonic()
+
+    def _ddccontrol_get(self) -> int | None:
         try:
             result = subprocess.run(
                 ["ddccontrol", "-r", self.register, self.device],
-                capture_output=True, text=True, timeout=5
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=5
+            )
+            return self._parse_ddccontrol(result.stdout)
+        except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
+            print(f"[ddc-brightness] Error reading brightness: {e}", file=sys.stderr)
+            return None
+
+    def _ddccontrol_begin_read(self, callback):
+        # Collect ddccontrol's stdout through an io watch so the main loop keeps
+        # running while it probes the monitor; give up after 5 s like the sync path
+        try:
+            pid, _stdin, stdout, _stderr = GLib.spawn_async(
+                ["ddccontrol", "-r", self.register, self.device],
+                flags=(GLib.SpawnFlags.SEARCH_PATH | GLib.SpawnFlags.STDERR_TO_DEV_NULL
+                       | GLib.SpawnFlags.DO_NOT_REAP_CHILD),
+                standard_output=True,
             )
-            # Parse output like: "Control 0x10: +/70/100 [Brightness]"
-            # or: " > current value = 70"
-            for line in result.stdout.splitlines():
-                m = re.search(r'\+/(\d+)/(\d+)', line)
+        except GLib.Error as e:
+            print(f"[ddc-brightness] Error reading brightness: {e}", file=sys.stderr)
+            self._finish_read(callback, None)
+            return
+        GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, lambda pid, status: GLib.spawn_close_pid(pid))
+
+        buf = bytearray()
+
+        def _on_output(fd, condition):
+            chunk = b""
+            if condition & GLib.IO_IN:
+                try:
+                    chunk = os.read(fd, 4096)
+                except OSError:
+                    pass
+            if chunk:
+                buf.extend(chunk)
+                return True
+            GLib.source_remove(timeout_id)
+            os.close(fd)
+            self._finish_read(callback, self._parse_ddccontrol(bytes(buf)))
+            return False
+
+        def _on_timeout():
+            GLib.source_remove(watch_id)
+            os.close(stdout)
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+            print("[ddc-brightness] Error reading brightness: ddccontrol timed out",
+                  file=sys.stderr)
+            self._finish_read(callback, None)
+            return False
+
+        watch_id = GLib.io_add_watch(stdout, GLib.PRIORITY_DEFAULT,
+                                     GLib.IO_IN | GLib.IO_HUP, _on_output)
+        timeout_id = GLib.timeout_add_seconds(5, _on_timeout)
+
+    @staticmethod
+    def _parse_ddccontrol(output: bytes) -> int | None:
+        # Cheap substring checks skip ddccontrol's probe noise without running a regex
+        for line in output.splitlines():
+            if b'/' in line:
+                m = _RE_TRIPLE.search(line)
                 if m:
                     return int(m.group(1))
-                m = re.search(r'current\s+value\s*=\s*(\d+)', line)
+            if b'current' in line:
+                m = _RE_CURRENT.search(line)
                 if m:
                     return int(m.group(1))
-            return None
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-            print(f"[ddc-brightness] Error reading brightness: {e}", file=sys.stderr)
-            return None
+        return None
 
-    def set_brightness(self, value: int) -> bool:
-        value = max(0, min(100, int(value)))
+    def _ddccontrol_set(self, value: int) -> bool:
         try:
             result = subprocess.run(
                 ["ddccontrol", "-r", self.register, "-w", str(value), self.device],
-                capture_output=True, text=True, timeout=5
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5
             )
             return result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
@@ -129,12 +411,52 @@ class DDCController:
             return False
 
 
+def _debounce_ms(monitors: list[MonitorInfo], fast_ms: int,
+                 slow_ms: int = DDCCONTROL_DEBOUNCE_MS) -> int:
+    """Write debounce: fast_ms when every controller talks to the bus directly,
+    otherwise slow_ms, long enough not to queue up ddccontrol processes."""
+    for mon in monitors:
+        if not (mon.brightness.is_direct and mon.contrast.is_direct):
+            return slow_ms
+    return fast_ms
+
+
+_CSS_INSTALLED = False
+
+
+def _install_css():
+    """Install the popup stylesheet on the default screen (once per process)."""
+    global _CSS_INSTALLED
+    if _CSS_INSTALLED:
+        return
+    css = Gtk.CssProvider()
+    css.load_from_data(b"""
+        window {
+            background-color: @theme_bg_color;
+            border: 1px solid @borders;
+        }
+        button {
+            min-height: 24px;
+            padding: 2px 4px;
+            font-size: 11px;
+        }
+    """)
+    Gtk.StyleContext.add_provider_for_screen(
+        Gdk.Screen.get_default(), css, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+    )
+    _CSS_INSTALLED = True
+
+
 class _SliderGroup:
     """A pair of brightness/contrast sliders for one monitor (or master)."""
 
+    BRIGHTNESS_PRESETS = (1, 10, 25, 50, 75, 100)
+
     def __init__(self, vbox, monitor: MonitorInfo | None, min_val, max_val, step,
-                 on_brightness, on_contrast, show_presets=False):
+                 on_brightness, on_contrast, show_presets=False,
+                 debounce_ms=DDCCONTROL_DEBOUNCE_MS):
         self.monitor = monitor
+        self._debounce_ms = debounce_ms
         self.is_applying_brightness = False
         self.is_applying_contrast = False
         self._brightness_debounce = None
@@ -168,13 +490,7 @@ class _SliderGroup:
 
         if show_presets:
             vbox.pack_start(Gtk.Separator(), False, False, 0)
-            btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-            btn_box.set_homogeneous(True)
-            vbox.pack_start(btn_box, False, False, 0)
-            for preset in [1, 10, 25, 50, 75, 100]:
-                btn = Gtk.Button(label=f"{preset}%")
-                btn.connect("clicked", self._on_preset_clicked, preset)
-                btn_box.pack_start(btn, True, True, 0)
+            self._build_preset_row(vbox)
 
         # Contrast
         vbox.pack_start(Gtk.Separator(), False, False, 0)
@@ -201,36 +517,63 @@ class _SliderGroup:
         self.contrast_label.set_width_chars(5)
         contrast_hbox.pack_start(self.contrast_label, False, False, 0)
 
-    def refresh(self):
+    def refresh(self, mirror: '_SliderGroup | None' = None):
+        """Re-read values from the monitor asynchronously.
+        If mirror is given, it is updated with the same values."""
         if self.monitor is None:
             return
-        val = self.monitor.brightness.get_brightness()
-        if val is not None:
-            self.set_brightness(val)
-        con = self.monitor.contrast.get_brightness()
-        if con is not None:
-            self.set_contrast(con)
+
+        def _on_brightness(val):
+            if val is not None:
+                self.set_brightness(val)
+                if mirror:
+                    mirror.set_brightness(val)
+
+        def _on_contrast(con):
+            if con is not None:
+                self.set_contrast(con)
+                if mirror:
+                    mirror.set_contrast(con)
+
+        self.monitor.brightness.get_brightness_async(_on_brightness)
+        self.monitor.contrast.get_brightness_async(_on_contrast)
+
+    def _build_preset_row(self, vbox):
+        btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+        btn_box.set_homogeneous(True)
+        vbox.pack_start(btn_box, False, False, 0)
+        for preset in self.BRIGHTNESS_PRESETS:
+            btn = Gtk.Button(label=f"{preset}%")
+            btn.connect("clicked", functools.partial(self._on_preset_clicked, value=preset))
+            btn_box.pack_start(btn, True, True, 0)
+
+    @staticmethod
+    def _set_label(label, value):
+        # Skip the Pango relayout when repeated updates land on the same integer
+        text = f"{value}%"
+        if label.get_text() != text:
+            label.set_text(text)
 
     def set_brightness(self, value):
         self.is_applying_brightness = True
         self.brightness_scale.set_value(value)
-        self.brightness_label.set_text(f"{value}%")
         self.is_applying_brightness = False
+        self._set_label(self.brightness_label, value)
 
     def set_contrast(self, value):
         self.is_applying_contrast = True
         self.contrast_scale.set_value(value)
-        self.contrast_label.set_text(f"{value}%")
         self.is_applying_contrast = False
+        self._set_label(self.contrast_label, value)
 
     def _on_brightness_changed(self, scale):
         if self.is_applying_brightness:
             return
         value = int(scale.get_value())
-        self.brightness_label.set_text(f"{value}%")
+        self._set_label(self.brightness_label, value)
         if self._brightness_debounce:
             GLib.source_remove(self._brightness_debounce)
-        self._brightness_debounce = GLib.timeout_add(150, self._apply_brightness, value)
+        self._brightness_debounce = GLib.timeout_add(self._debounce_ms, self._apply_brightness, value)
 
     def _apply_brightness(self, value):
         self._brightness_debounce = None
@@ -241,10 +584,10 @@ class _SliderGroup:
         if self.is_applying_contrast:
             return
         value = int(scale.get_value())
-        self.contrast_label.set_text(f"{value}%")
+        self._set_label(self.contrast_label, value)
         if self._contrast_debounce:
             GLib.source_remove(self._contrast_debounce)
-        self._contrast_debounce = GLib.timeout_add(150, self._apply_contrast, value)
+        self._contrast_debounce = GLib.timeout_add(self._debounce_ms, self._apply_contrast, value)
 
     def _apply_contrast(self, value):
         self._contrast_debounce = None
@@ -252,10 +595,7 @@ class _SliderGroup:
         return False
 
     def _on_preset_clicked(self, button, value):
-        self.brightness_label.set_text(f"{value}%")
-        self.is_applying_brightness = True
-        self.brightness_scale.set_value(value)
-        self.is_applying_brightness = False
+        self.set_brightness(value)
         self._on_brightness(self, value)
 
 
@@ -269,7 +609,7 @@ class BrightnessPopup(Gtk.Window):
     ]
 
     def __init__(self, monitors: list[MonitorInfo], min_val: int, max_val: int, step: int,
-                 on_color_temp=None):
+                 seat: Gdk.Seat, on_color_temp=None):
         super().__init__(type=Gtk.WindowType.TOPLEVEL)
 
         self.monitors = monitors
@@ -292,16 +632,24 @@ class BrightnessPopup(Gtk.Window):
 
         self.set_position(Gtk.WindowPosition.NONE)
 
+        self._seat = seat
+        self._grabbed = False
+        self.add_events(Gdk.EventMask.BUTTON_PRESS_MASK)
+
         self.connect("focus-out-event", self._on_focus_out)
+        self.connect("grab-broken-event", self._on_grab_broken)
         self.connect("key-press-event", self._on_key_press)
+        self.connect("button-press-event", self._on_button_press)
+        self.connect("map-event", self._on_map_event)
         self.connect("show", lambda w: self._set_visible(True))
-        self.connect("hide", lambda w: self._set_visible(False))
+        self.connect("hide", self._on_hide)
         self.connect("realize", self._on_realize)
 
         vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         self.add(vbox)
 
         multi = len(monitors) > 1
+        debounce_ms = _debounce_ms(monitors, SLIDER_DEBOUNCE_MS)
 
         if multi:
             header = Gtk.Label()
@@ -313,7 +661,7 @@ class BrightnessPopup(Gtk.Window):
                 master_box, None, min_val, max_val, step,
                 on_brightness=self._on_master_brightness,
                 on_contrast=self._on_master_contrast,
-                show_presets=True)
+                show_presets=True, debounce_ms=debounce_ms)
 
         for i, mon in enumerate(monitors):
             if multi:
@@ -328,7 +676,7 @@ class BrightnessPopup(Gtk.Window):
                 mon_box, mon, min_val, max_val, step,
                 on_brightness=self._on_monitor_brightness,
                 on_contrast=self._on_monitor_contrast,
-                show_presets=not multi)
+                show_presets=not multi, debounce_ms=debounce_ms)
             self._monitor_groups.append(group)
 
         if on_color_temp is not None:
@@ -344,22 +692,6 @@ class BrightnessPopup(Gtk.Window):
                 temp_box.pack_start(btn, True, True, 0)
             vbox.pack_start(temp_box, False, False, 0)
 
-        css = Gtk.CssProvider()
-        css.load_from_data(b"""
-            window {
-                background-color: @theme_bg_color;
-                border: 1px solid @borders;
-            }
-            button {
-                min-height: 24px;
-                padding: 2px 4px;
-                font-size: 11px;
-            }
-        """)
-        Gtk.StyleContext.add_provider_for_screen(
-            Gdk.Screen.get_default(), css, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
-
     def _on_temp_clicked(self, button, temp: int):
         if self._on_color_temp:
             self._on_color_temp(temp)
@@ -381,18 +713,17 @@ class BrightnessPopup(Gtk.Window):
             mg.monitor.contrast.set_brightness(value)
 
     def _on_realize(self, widget):
+        self._place()
+
+    def _place(self):
         self.get_window().move_resize(
             self._position[0], self._position[1],
             self.get_allocated_width(), self.get_allocated_height()
         )
 
     def refresh_value(self):
-        for group in self._monitor_groups:
-            group.refresh()
-        if self._master_group and self._monitor_groups:
-            first = self._monitor_groups[0]
-            self._master_group.set_brightness(int(first.brightness_scale.get_value()))
-            self._master_group.set_contrast(int(first.contrast_scale.get_value()))
+        for i, group in enumerate(self._monitor_groups):
+            group.refresh(mirror=self._master_group if i == 0 else None)
 
     def update_all(self, brightness: int, contrast: int):
         """Update all sliders to given values."""
@@ -413,15 +744,48 @@ class BrightnessPopup(Gtk.Window):
     def _set_visible(self, visible):
         self._visible = visible
 
+    def _on_map_event(self, widget, event):
+        # Grab pointer and keyboard so a click anywhere outside dismisses the popup
+        status = self._seat.grab(self.get_window(), Gdk.SeatCapabilities.ALL,
+                                 True, None, event, None)
+        self._grabbed = status == Gdk.GrabStatus.SUCCESS
+        if not self._grabbed:
+            print(f"[ddc-brightness] Could not grab seat for popup: {status}, "
+                  f"dismissing on focus-out instead", file=sys.stderr)
+        return False
+
+    def _on_grab_broken(self, widget, event):
+        # Another grab (e.g. a Gtk.Menu popup) took over; rely on focus-out from now on
+        self._grabbed = False
+        return False
+
+    def _on_hide(self, widget):
+        if self._grabbed:
+            self._seat.ungrab()
+            self._grabbed = False
+        self._set_visible(False)
+
     def _on_focus_out(self, widget, event):
-        GLib.timeout_add(100, self._check_focus)
+        # Fallback dismissal while the popup holds no seat grab
+        if not self._grabbed:
+            GLib.timeout_add(100, self._check_focus)
         return False
 
     def _check_focus(self):
-        if not self.is_active():
+        if not self._grabbed and not self.is_active():
             self.hide()
         return False
 
+    def _on_button_press(self, widget, event):
+        # While grabbed, presses outside the popup are reported to it as well
+        _, ox, oy = self.get_window().get_origin()
+        inside = (ox <= event.x_root < ox + self.get_allocated_width()
+                  and oy <= event.y_root < oy + self.get_allocated_height())
+        if not inside:
+            self.hide()
+            return True
+        return False
+
     def _on_key_press(self, widget, event):
         if event.keyval == Gdk.KEY_Escape:
             self.hide()
@@ -431,13 +795,14 @@ class BrightnessPopup(Gtk.Window):
     def toggle_at(self, x: int, y: int):
         if self._visible:
             self.hide()
-            self.unrealize()
         else:
             self.refresh_value()
             self._position = (x, y)
             self.move(x, y)
             self.show_all()
-            self.move(x, y)
+            # The window stays realized between opens, so "realize" only
+            # positions it the first time; re-apply the position on later maps
+            self._place()
             self.present()
             if self.get_window():
                 self.get_window().focus(Gdk.CURRENT_TIME)
@@ -475,10 +840,22 @@ class TrayApp:
         self.max_val = max_val
         self.scroll_step = scroll_step
         self.presets = presets or []
-        self.popup = BrightnessPopup(monitors, min_val, max_val, step,
+        self._display = Gdk.Display.get_default()
+        self._seat = self._display.get_default_seat()
+        self._pointer = self._seat.get_pointer()
+        self.popup = BrightnessPopup(monitors, min_val, max_val, step, self._seat,
                                      on_color_temp=self._on_color_temp)
-        self._cached_brightness = None
-        self._scroll_debounce_id = None
+        self._reading_brightness = False
+        self._unread_delta = 0
+        self._pending_value: int | None = None
+        self._timer_armed = False
+        # ddccontrol-backed controllers are written by one worker thread at a time;
+        # _slow_value holds the newest value waiting for it
+        self._slow_controllers = [m.brightness for m in monitors if not m.brightness.is_direct]
+        self._slow_value: int | None = None
+        self._slow_writer_busy = False
+        self._scroll_debounce_ms = _debounce_ms(monitors, SCROLL_DEBOUNCE_MS,
+                                                DDCCONTROL_SCROLL_DEBOUNCE_MS)
         self._redshift_paused = False
 
         self.status_icon = None
@@ -510,6 +887,7 @@ class TrayApp:
             self.status_icon.connect("activate", self._on_left_click)
             self.status_icon.connect("popup-menu", self._on_right_click)
             self.status_icon.connect("scroll-event", self._on_scroll_event)
+            self._menu = self._build_menu()
             print("[ddc-brightness] Using GtkStatusIcon tray icon", file=sys.stderr)
             return True
         except Exception:
@@ -518,8 +896,7 @@ class TrayApp:
     def _on_left_click(self, icon):
         success, screen, area, orientation = icon.get_geometry()
         if success:
-            display = Gdk.Display.get_default()
-            monitor = display.get_monitor_at_point(area.x, area.y)
+            monitor = self._display.get_monitor_at_point(area.x, area.y)
             popup_width = 280
             popup_height = 210 * len(self.monitors) + (60 if len(self.monitors) > 1 else 0)
 
@@ -538,10 +915,7 @@ class TrayApp:
 
             self.popup.toggle_at(x, y)
         else:
-            display = Gdk.Display.get_default()
-            seat = display.get_default_seat()
-            pointer = seat.get_pointer()
-            _, x, y = pointer.get_position()
+            _, x, y = self._pointer.get_position()
             self.popup.toggle_at(x - 140, y + 10)
 
     @staticmethod
@@ -582,21 +956,29 @@ class TrayApp:
                 item.connect("activate", self._on_apply_preset, i)
                 menu.append(item)
             menu.append(Gtk.SeparatorMenuItem())
-        if self._is_redshift_running():
-            label = "▶ Resume Redshift" if self._redshift_paused else "⏸ Pause Redshift"
-            item_rs = Gtk.MenuItem(label=label)
-            item_rs.connect("activate", self._on_toggle_redshift)
-            menu.append(item_rs)
-            menu.append(Gtk.SeparatorMenuItem())
+        self._redshift_item = Gtk.MenuItem(label="⏸ Pause Redshift")
+        self._redshift_item.connect("activate", self._on_toggle_redshift)
+        menu.append(self._redshift_item)
+        self._redshift_sep = Gtk.SeparatorMenuItem()
+        menu.append(self._redshift_sep)
         item_quit = Gtk.MenuItem(label="Quit")
         item_quit.connect("activate", lambda w: Gtk.main_quit())
         menu.append(item_quit)
         menu.show_all()
+        self._update_redshift_item()
         return menu
 
+    def _update_redshift_item(self):
+        """Show the redshift toggle only while redshift runs, labelled by its state."""
+        running = self._is_redshift_running()
+        self._redshift_item.set_visible(running)
+        self._redshift_sep.set_visible(running)
+        self._redshift_item.set_label(
+            "▶ Resume Redshift" if self._redshift_paused else "⏸ Pause Redshift")
+
     def _on_right_click(self, icon, button, time):
-        menu = self._build_menu()
-        menu.popup(None, None, None, None, button, time)
+        self._update_redshift_item()
+        self._menu.popup(None, None, None, None, button, time)
 
     @staticmethod
     def _is_redshift_running() -> bool:
@@ -610,6 +992,7 @@ class TrayApp:
         try:
             subprocess.run(["pkill", "-USR1", "redshift"], capture_output=True)
             self._redshift_paused = not self._redshift_paused
+            self._update_redshift_item()
         except Exception:
             pass
 
@@ -638,10 +1021,7 @@ class TrayApp:
         print("[ddc-brightness] Using AppIndicator tray icon", file=sys.stderr)
 
     def _on_indicator_activate(self, widget):
-        display = Gdk.Display.get_default()
-        seat = display.get_default_seat()
-        pointer = seat.get_pointer()
-        _, x, y = pointer.get_position()
+        _, x, y = self._pointer.get_position()
         self.popup.toggle_at(x, y)
 
     def _on_scroll_event(self, icon, event):
@@ -657,26 +1037,71 @@ class TrayApp:
             self._adjust_brightness(-self.scroll_step)
 
     def _adjust_brightness(self, delta):
-        if self._cached_brightness is None:
-            self._cached_brightness = self.monitors[0].brightness.get_brightness()
-            if self._cached_brightness is None:
-                return
-        new_val = max(self.min_val, min(self.max_val, self._cached_brightness + delta))
-        if new_val == self._cached_brightness:
+        current = self._pending_value
+        if current is None:
+            current = self._slow_value
+        if current is None:
+            current = self.monitors[0].brightness.cached_value
+        if current is None:
+            # Accumulate notches until the read completes
+            self._unread_delta += delta
+            if not self._reading_brightness:
+                self._reading_brightness = True
+                self.monitors[0].brightness.get_brightness_async(self._on_brightness_read)
+            return
+        new_val = max(self.min_val, min(self.max_val, current + delta))
+        if new_val == current:
             return
-        self._cached_brightness = new_val
         if self.popup._visible:
             self.popup.update_value(new_val)
-        if self._scroll_debounce_id:
-            GLib.source_remove(self._scroll_debounce_id)
-        self._scroll_debounce_id = GLib.timeout_add(100, self._apply_scroll_brightness, new_val)
+        self._pending_value = new_val
+        if not self._timer_armed:
+            self._timer_armed = True
+            GLib.timeout_add(self._scroll_debounce_ms, self._flush_pending)
+
+    def _on_brightness_read(self, value):
+        self._reading_brightness = False
+        delta, self._unread_delta = self._unread_delta, 0
+        if value is None:
+            return
+        self._adjust_brightness(delta)
+
+    def _flush_pending(self):
+        """Apply the latest scrolled value; earlier notches in the burst are dropped."""
+        value = self._pending_value
+        self._pending_value = None
+        self._timer_armed = False
+        if value is None:
+            return False
+        for mon in self.monitors:
+            if mon.brightness.is_direct:
+                mon.brightness.set_brightness(value)
+        if self._slow_controllers:
+            self._slow_value = value
+            if not self._slow_writer_busy:
+                self._start_slow_write()
+        return False
+
+    def _start_slow_write(self):
+        # ddccontrol writes take hundreds of ms; keep them off the main loop, one at a time
+        value, self._slow_value = self._slow_value, None
+        self._slow_writer_busy = True
+        # Record the value on the main thread so the next notch builds on it,
+        # not on the stale cache left until ddccontrol returns
+        for ctrl in self._slow_controllers:
+            ctrl._remember(value)
 
-    def _apply_scroll_brightness(self, value):
-        self._scroll_debounce_id = None
         def _set_all():
-            for mon in self.monitors:
-                mon.brightness.set_brightness(value)
+            for ctrl in self._slow_controllers:
+                ctrl.set_brightness(value)
+            GLib.idle_add(self._on_slow_write_done)
+
         threading.Thread(target=_set_all, daemon=True).start()
+
+    def _on_slow_write_done(self):
+        self._slow_writer_busy = False
+        if self._slow_value is not None:
+            self._start_slow_write()
         return False
 
 
@@ -699,6 +1124,7 @@ class StandaloneWindow(Gtk.Window):
         self.add(vbox)
 
         multi = len(monitors) > 1
+        debounce_ms = _debounce_ms(monitors, SLIDER_DEBOUNCE_MS)
 
         if multi:
             header = Gtk.Label()
@@ -710,7 +1136,7 @@ class StandaloneWindow(Gtk.Window):
                 master_box, None, min_val, max_val, step,
                 on_brightness=self._on_master_brightness,
                 on_contrast=self._on_master_contrast,
-                show_presets=True)
+                show_presets=True, debounce_ms=debounce_ms)
 
         for mon in monitors:
             if multi:
@@ -725,7 +1151,7 @@ class StandaloneWindow(Gtk.Window):
                 mon_box, mon, min_val, max_val, step,
                 on_brightness=self._on_monitor_brightness,
                 on_contrast=self._on_monitor_contrast,
-                show_presets=not multi)
+                show_presets=not multi, debounce_ms=debounce_ms)
             self._monitor_groups.append(group)
 
         self._refresh()
@@ -747,12 +1173,8 @@ class StandaloneWindow(Gtk.Window):
             mg.monitor.contrast.set_brightness(value)
 
     def _refresh(self):
-        for group in self._monitor_groups:
-            group.refresh()
-        if self._master_group and self._monitor_groups:
-            first = self._monitor_groups[0]
-            self._master_group.set_brightness(int(first.brightness_scale.get_value()))
-            self._master_group.set_contrast(int(first.contrast_scale.get_value()))
+        for i, group in enumerate(self._monitor_groups):
+            group.refresh(mirror=self._master_group if i == 0 else None)
 
 
 def main():
@@ -868,6 +1290,7 @@ Examples:
         win = StandaloneWindow(monitors, args.min, args.max, args.step)
         win.show_all()
     else:
+        _install_css()
         app = TrayApp(monitors, args.min, args.max, args.step,
                       scroll_step=scroll_step, presets=presets)
 